@@ -7,6 +7,32 @@ Configurations are loaded based on the FLASK_ENV environment variable.
 import os
 from datetime import timedelta
 
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+
+
+def _worker_database_url(url):
+    """
+    Give each pytest-xdist worker its own database when testing against a real server.
+
+    Args:
+        url: Database URL, or None
+
+    Returns:
+        The URL with the worker id (e.g. gw0) appended to the database name,
+        or the URL unchanged outside an xdist worker or for in-memory SQLite
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not url or not worker:
+        return url
+
+    parsed = make_url(url)
+    if not parsed.database or parsed.database == ":memory:":
+        return url  # in-memory SQLite is already private to each worker process
+
+    name, ext = os.path.splitext(parsed.database)
+    return parsed.set(database=f"{name}_{worker}{ext}").render_as_string(hide_password=False)
+
 
 class BaseConfig:
     """Base configuration with common settings."""
@@ -18,6 +44,9 @@ class BaseConfig:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False
 
+    # Password hashing (method passed to werkzeug's generate_password_hash)
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256"
+
     # Session
     PERMANENT_SESSION_LIFETIME = timedelta(days=7)
     SESSION_COOKIE_SECURE = False  # Set to True in production with HTTPS
@@ -105,14 +134,24 @@ class TestingConfig(BaseConfig):
     DEBUG = False
     TESTING = True
 
-    # Database - Separate test database
-    SQLALCHEMY_DATABASE_URI = os.environ.get("TEST_DATABASE_URL") or "sqlite:///" + os.path.join(
-        os.path.dirname(os.path.dirname(__file__)), "test_quiz_app.db"
+    # Database - In-memory SQLite (one per process, so pytest-xdist workers don't collide).
+    # StaticPool keeps a single connection alive so the schema survives for the whole session.
+    # TEST_DATABASE_URL overrides it; under xdist each worker gets a suffixed database name.
+    SQLALCHEMY_DATABASE_URI = (
+        _worker_database_url(os.environ.get("TEST_DATABASE_URL")) or "sqlite://"
+    )
+    SQLALCHEMY_ENGINE_OPTIONS = (
+        {}
+        if os.environ.get("TEST_DATABASE_URL")
+        else {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}}
     )
 
     # Disable CSRF for testing
     WTF_CSRF_ENABLED = False
 
+    # Minimum hashing cost - the key derivation is deliberately slow otherwise
+    PASSWORD_HASH_METHOD = "pbkdf2:sha256:1"
+
     # Disable rate limiting for tests
     RATELIMIT_ENABLED = False
 
@@ -5,6 +5,7 @@ Quiz model for managing quiz categories and metadata.
 from datetime import datetime
 
 from app.extensions import db
+from app.models.attempt import Attempt
 
 
 class Quiz(db.Model):
@@ -67,12 +68,15 @@ class Quiz(db.Model):
         Returns:
             float: Average percentage score, or 0 if no completed attempts
         """
-        completed_attempts = [a for a in self.attempts if a.completed_at is not None]
-        if not completed_attempts:
+        average = db.session.execute(
+            db.select(db.func.avg(Attempt.percentage)).where(
+                Attempt.quiz_id == self.id, Attempt.completed_at.isnot(None)
+            )
+        ).scalar()
+        if average is None:
             return 0.0
 
-        total_percentage = sum(a.percentage for a in completed_attempts)
-        return round(total_percentage / len(completed_attempts), 1)
+        return round(average, 1)
 
     def get_completion_rate(self):
         """
@@ -81,11 +85,16 @@ class Quiz(db.Model):
         Returns:
             float: Completion rate percentage
         """
-        if not self.attempts:
+        # COUNT(completed_at) skips NULLs, so both counts come from one SELECT
+        started, completed = db.session.execute(
+            db.select(db.func.count(Attempt.id), db.func.count(Attempt.completed_at)).where(
+                Attempt.quiz_id == self.id
+            )
+        ).one()
+        if not started:
             return 0.0
 
-        completed = sum(1 for a in self.attempts if a.completed_at is not None)
-        return round((completed / len(self.attempts)) * 100, 1)
+        return round((completed / started) * 100, 1)
 
     def to_dict(self):
         """
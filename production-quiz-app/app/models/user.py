@@ -2,13 +2,16 @@
 User model with enhanced authentication and security features.
 """
 
+import hmac
 import secrets
 from datetime import datetime, timedelta
 
+from flask import current_app
 from flask_login import UserMixin
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from app.extensions import db
+from app.models.attempt import Attempt
 
 
 class User(UserMixin, db.Model):
@@ -39,10 +42,10 @@ class User(UserMixin, db.Model):
 
     # Email verification
     email_verified = db.Column(db.Boolean, default=False, nullable=False)
-    verification_token = db.Column(db.String(100), unique=True, nullable=True)
+    verification_token = db.Column(db.String(100), unique=True, nullable=True, index=True)
 
     # Password reset
-    password_reset_token = db.Column(db.String(100), unique=True, nullable=True)
+    password_reset_token = db.Column(db.String(100), unique=True, nullable=True, index=True)
     reset_token_expires = db.Column(db.DateTime, nullable=True)
 
     # Account security
@@ -77,9 +80,11 @@ class User(UserMixin, db.Model):
         Args:
             password: Plain text password
         """
-        # Using Werkzeug's generate_password_hash with 'argon2' method
-        # This uses argon2-cffi under the hood if installed
-        self.password_hash = generate_password_hash(password, method="pbkdf2:sha256")
+        # Using Werkzeug's generate_password_hash with the configured method
+        # (cost is lowered in TestingConfig only)
+        self.password_hash = generate_password_hash(
+            password, method=current_app.config.get("PASSWORD_HASH_METHOD", "pbkdf2:sha256")
+        )
         # Note: To use argon2, install argon2-cffi and use method='argon2'
         # For now using pbkdf2:sha256 for compatibility
 
@@ -141,7 +146,8 @@ class User(UserMixin, db.Model):
         if not self.password_reset_token or not self.reset_token_expires:
             return False
 
-        if self.password_reset_token != token:
+        # Constant-time comparison so response timing doesn't leak the token
+        if not token or not hmac.compare_digest(self.password_reset_token.encode(), token.encode()):
             return False
 
         if datetime.utcnow() > self.reset_token_expires:
@@ -201,18 +207,22 @@ class User(UserMixin, db.Model):
         Returns:
             dict: Statistics including total_attempts, avg_score, best_score
         """
-        if not self.attempts:
-            return {"total_attempts": 0, "avg_score": 0, "best_score": 0}
+        # Aggregate in a single SELECT instead of loading every attempt row
+        total, avg_percentage, best_percentage = db.session.execute(
+            db.select(
+                db.func.count(Attempt.id),
+                db.func.avg(Attempt.percentage),
+                db.func.max(Attempt.percentage),
+            ).where(Attempt.user_id == self.id, Attempt.completed_at.isnot(None))
+        ).one()
 
-        completed_attempts = [a for a in self.attempts if a.completed_at is not None]
-        if not completed_attempts:
+        if not total:
             return {"total_attempts": 0, "avg_score": 0, "best_score": 0}
 
-        percentages = [a.percentage for a in completed_attempts]
         return {
-            "total_attempts": len(completed_attempts),
-            "avg_score": round(sum(percentages) / len(percentages), 1),
-            "best_score": round(max(percentages), 1),
+            "total_attempts": total,
+            "avg_score": round(avg_percentage, 1),
+            "best_score": round(best_percentage, 1),
         }
 
     # Flask-Login required methods
@@ -0,0 +1,39 @@
+"""Index user verification and password reset token columns
+
+Revision ID: 111aab3499d9
+Revises: d0a72a14ad60
+Create Date: 2026-10-15 23:05:41.218734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '111aab3499d9'
+down_revision = 'd0a72a14ad60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_users_password_reset_token'), ['password_reset_token'], unique=True)
+        batch_op.create_index(batch_op.f('ix_users_verification_token'), ['verification_token'], unique=True)
+
+    # The unique indexes replace the unnamed UNIQUE constraints from the initial
+    # schema. PostgreSQL names those <table>_<column>_key; SQLite keeps them inline
+    # in the table definition, where they are redundant but harmless.
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_constraint('users_password_reset_token_key', 'users', type_='unique')
+        op.drop_constraint('users_verification_token_key', 'users', type_='unique')
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.create_unique_constraint('users_verification_token_key', 'users', ['verification_token'])
+        op.create_unique_constraint('users_password_reset_token_key', 'users', ['password_reset_token'])
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_verification_token'))
+        batch_op.drop_index(batch_op.f('ix_users_password_reset_token'))
@@ -8,18 +8,55 @@ import os
 
 import pytest
 from flask import session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
 
 from app import create_app
 from app.extensions import db
 from app.models import Attempt, Question, Quiz, User, UserAnswer
 
 
+def enable_sqlite_savepoints(engine):
+    """
+    Let pysqlite run SAVEPOINTs inside an outer transaction.
+
+    pysqlite starts transactions lazily and commits on its own, which breaks
+    nested transactions. Disable that and emit BEGIN explicitly, as described in
+    the SQLAlchemy SQLite dialect docs.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+class ExternalTransactionSession(Session):
+    """
+    Flask-SQLAlchemy session that honours an explicit ``bind``.
+
+    Flask-SQLAlchemy 3.0 always routes queries to the app engine, so a session
+    bound to the per-test connection would otherwise bypass its transaction.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.bind is not None:
+            return self.bind
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+
 @pytest.fixture(scope="session")
 def app():
     """
     Create and configure a Flask application for testing.
 
     Uses testing configuration with in-memory SQLite database.
+    Under pytest-xdist each worker process builds its own schema here.
     Scope: session (created once per test session)
     """
     # Set testing environment
@@ -30,6 +67,9 @@ def app():
 
     # Establish application context
     with app.app_context():
+        # Must be registered before the first connection is opened
+        enable_sqlite_savepoints(db.engine)
+
         # Create all database tables
         db.create_all()
 
@@ -60,30 +100,73 @@ def runner(app):
     return app.test_cli_runner()
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="function", autouse=True)
 def db_session(app):
     """
-    Create a database session for testing with transaction rollback.
+    Run each test inside a database transaction that is rolled back afterwards.
 
-    Each test gets a clean database state through transaction rollback.
+    The session joins an outer connection-level transaction, so commits made by
+    tests, factories and services only release SAVEPOINTs and nothing has to be
+    deleted between tests.
     Scope: function (new session for each test)
     """
-    with app.app_context():
-        # Begin a nested transaction
-        connection = db.engine.connect()
-        transaction = connection.begin()
+    connection = db.engine.connect()
+    transaction = connection.begin()
+
+    # Bind session to connection
+    original_session = db.session
+    db.session = db._make_scoped_session(
+        {
+            "bind": connection,
+            "join_transaction_mode": "create_savepoint",
+            "class_": ExternalTransactionSession,
+        }
+    )
+
+    yield db.session
 
-        # Bind session to connection
-        session_options = dict(bind=connection, binds={})
-        sess = db.create_scoped_session(options=session_options)
-        db.session = sess
+    # Rollback transaction (undo all changes)
+    db.session.remove()
+    db.session = original_session
+    transaction.rollback()
+    connection.close()
 
-        yield sess
 
-        # Rollback transaction (undo all changes)
-        sess.close()
-        transaction.rollback()
-        connection.close()
+class QueryCounter:
+    """Count SQL statements sent to the database cursor, ignoring savepoint bookkeeping."""
+
+    # Emitted by the per-test nested transaction, not by the code under test
+    IGNORED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(self.IGNORED_PREFIXES):
+            self.count += 1
+
+    def reset(self):
+        """Reset the counter, e.g. after flushing test setup data."""
+        self.count = 0
+
+
+@pytest.fixture(scope="function")
+def query_counter(app):
+    """
+    Count queries executed against the test database engine.
+
+    Flush pending setup data, load any instance the code under test reads
+    (setup commits expire it), then call ``reset()`` so only the code's own
+    round-trips are counted.
+    Scope: function (new counter for each test)
+    """
+    counter = QueryCounter()
+    engine = db.engine
+    event.listen(engine, "before_cursor_execute", counter)
+
+    yield counter
+
+    event.remove(engine, "before_cursor_execute", counter)
 
 
 @pytest.fixture(scope="function")
@@ -111,10 +194,6 @@ def sample_user(app):
 
         yield user
 
-        # Cleanup: delete user and cascade to attempts/answers
-        db.session.delete(user)
-        db.session.commit()
-
 
 @pytest.fixture(scope="function")
 def sample_admin_user(app):
@@ -139,9 +218,6 @@ def sample_admin_user(app):
 
         yield user
 
-        db.session.delete(user)
-        db.session.commit()
-
 
 @pytest.fixture(scope="function")
 def sample_quiz(app):
@@ -221,10 +297,6 @@ def sample_quiz(app):
 
         yield quiz
 
-        # Cleanup: delete quiz (cascade deletes questions)
-        db.session.delete(quiz)
-        db.session.commit()
-
 
 @pytest.fixture(scope="function")
 def auth_headers(client, sample_user):
@@ -282,8 +354,6 @@ def completed_attempt(app, sample_user, sample_quiz):
 
         yield attempt
 
-        # Cleanup handled by cascade delete from sample_user
-
 
 @pytest.fixture(scope="function")
 def in_progress_attempt(app, sample_user, sample_quiz):
@@ -299,24 +369,3 @@ def in_progress_attempt(app, sample_user, sample_quiz):
         db.session.refresh(attempt)
 
         yield attempt
-
-        # Cleanup handled by cascade delete from sample_user
-
-
-@pytest.fixture(autouse=True)
-def reset_db_session(app):
-    """
-    Automatically reset database session and clear data after each test.
-
-    This fixture runs automatically for every test to ensure clean state.
-    """
-    yield
-
-    with app.app_context():
-        db.session.remove()
-        # Clear all tables except migrations (if using Alembic)
-        # This ensures each test starts with clean database
-        db.session.rollback()
-        for table in reversed(db.metadata.sorted_tables):
-            db.session.execute(table.delete())
-        db.session.commit()
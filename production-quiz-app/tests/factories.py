@@ -9,10 +9,18 @@ from datetime import datetime, timedelta
 
 import factory
 from factory import fuzzy
+from werkzeug.security import generate_password_hash
 
+from app.config import TestingConfig
 from app.extensions import db
 from app.models import Attempt, Question, Quiz, User, UserAnswer
 
+# Default password for factory users, hashed once at import instead of per instance
+TEST_PASSWORD = "TestPass123"
+TEST_PASSWORD_HASH = generate_password_hash(
+    TEST_PASSWORD, method=TestingConfig.PASSWORD_HASH_METHOD
+)
+
 
 class BaseFactory(factory.alchemy.SQLAlchemyModelFactory):
     """
@@ -26,6 +34,12 @@ class BaseFactory(factory.alchemy.SQLAlchemyModelFactory):
         sqlalchemy_session = db.session
         sqlalchemy_session_persistence = "commit"
 
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        """Save through the current db.session (swapped per test by conftest)."""
+        cls._meta.sqlalchemy_session = db.session
+        return super()._create(model_class, *args, **kwargs)
+
 
 class UserFactory(BaseFactory):
     """
@@ -39,10 +53,12 @@ class UserFactory(BaseFactory):
 
     class Meta:
         model = User
+        # Flushing makes the row visible to queries in the same transaction without a COMMIT
+        sqlalchemy_session_persistence = "flush"
 
     username = factory.Sequence(lambda n: f"user{n}")
     email = factory.LazyAttribute(lambda obj: f"{obj.username}@example.com")
-    password_hash = factory.PostGenerationMethodCall("set_password", "TestPass123")
+    password_hash = TEST_PASSWORD_HASH
     is_active = True
     is_admin = False
     email_verified = True
@@ -77,7 +93,7 @@ class UnverifiedUserFactory(UserFactory):
     """
 
     email_verified = False
-    verification_token = factory.Faker("uuid4")
+    verification_token = factory.Sequence(lambda n: f"verify-token-{n}")
 
 
 class LockedUserFactory(UserFactory):
@@ -115,6 +131,7 @@ class QuizFactory(BaseFactory):
             "Data Science",
         ]
     )
+    title = factory.LazyAttribute(lambda obj: obj.category)
     description = factory.LazyAttribute(lambda obj: f"Test your knowledge of {obj.category}")
     icon = factory.Iterator(["robot", "pencil", "target", "code", "web", "chart"])
     total_questions = 10
@@ -149,7 +166,7 @@ class QuestionFactory(BaseFactory):
 
     quiz = factory.SubFactory(QuizFactory)
     quiz_id = factory.LazyAttribute(lambda obj: obj.quiz.id)
-    question = factory.Faker("sentence", nb_words=10)
+    question_text = factory.Faker("sentence", nb_words=10)
     option_1 = factory.Faker("word")
     option_2 = factory.Faker("word")
     option_3 = factory.Faker("word")
@@ -159,6 +176,34 @@ class QuestionFactory(BaseFactory):
     explanation = factory.Faker("sentence", nb_words=15)
     order_index = factory.Sequence(lambda n: n)
 
+    # Fixed defaults for build_fast(); underscore-prefixed so factory_boy ignores it
+    _fast_defaults = {
+        "question_text": "Q",
+        "option_1": "A",
+        "option_2": "B",
+        "option_3": "C",
+        "option_4": "D",
+        "correct_answer": 0,
+        "difficulty": "easy",
+        "explanation": "E",
+        "order_index": 0,
+    }
+
+    @classmethod
+    def build_fast(cls, **overrides):
+        """
+        Build an unsaved Question from fixed defaults, bypassing Faker.
+
+        Intended for tests that only exercise in-memory Question methods.
+
+        Args:
+            **overrides: Override default values
+
+        Returns:
+            Unsaved Question instance
+        """
+        return Question(**{**cls._fast_defaults, **overrides})
+
 
 class EasyQuestionFactory(QuestionFactory):
     """Factory for creating easy Question instances."""
@@ -206,7 +251,7 @@ class AttemptFactory(BaseFactory):
         Create a completed attempt with score and completion time.
 
         Args:
-            **kwargs: Override default values
+            **kwargs: Override default values; total_questions defaults to the quiz's count
 
         Returns:
             Completed Attempt instance
@@ -217,8 +262,14 @@ class AttemptFactory(BaseFactory):
         if "time_taken" not in kwargs:
             kwargs["time_taken"] = fuzzy.FuzzyInteger(60, 1800).fuzz()  # 1-30 mins
 
+        total_questions = kwargs.pop("total_questions", None)
+
         attempt = cls(**kwargs)
-        attempt.complete(score=kwargs["score"], time_taken=kwargs.get("time_taken"))
+        attempt.complete(
+            score=kwargs["score"], total_questions=total_questions or attempt.quiz.total_questions
+        )
+        # complete() derives time_taken from started_at; keep the requested duration instead
+        attempt.time_taken = kwargs["time_taken"]
 
         return attempt
 
@@ -376,7 +427,8 @@ def create_completed_quiz_attempt(user, quiz, score=None):
         answers.append(answer)
 
     # Complete attempt
-    attempt.complete(score=score, time_taken=fuzzy.FuzzyInteger(60, 1800).fuzz())
+    attempt.complete(score=score, total_questions=total)
+    attempt.time_taken = fuzzy.FuzzyInteger(60, 1800).fuzz()
     db.session.commit()
 
     return attempt, answers
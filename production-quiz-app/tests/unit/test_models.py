@@ -115,6 +115,15 @@ class TestUserModel:
 
             assert user.verify_reset_token("wrong_token") is False
 
+    def test_verify_reset_token_non_ascii(self, app):
+        """Test verifying a reset token containing non-ASCII characters."""
+        with app.app_context():
+            user = UserFactory()
+            user.generate_reset_token()
+            db.session.commit()
+
+            assert user.verify_reset_token("wrong_tökén") is False
+
     def test_verify_reset_token_expired(self, app):
         """Test verifying expired reset token."""
         with app.app_context():
@@ -198,10 +207,10 @@ class TestUserModel:
             stats = user.get_stats()
 
             assert stats["total_attempts"] == 0
-            assert stats["average_score"] == 0
+            assert stats["avg_score"] == 0
             assert stats["best_score"] == 0
 
-    def test_get_stats_with_attempts(self, app):
+    def test_get_stats_with_attempts(self, app, query_counter):
         """Test getting user stats with completed attempts."""
         with app.app_context():
             user = UserFactory()
@@ -210,11 +219,16 @@ class TestUserModel:
             # Create 3 completed attempts
             for score in [7, 8, 9]:
                 _ = AttemptFactory.create_completed(user=user, quiz=quiz, score=score)
+            db.session.flush()
+            _ = user.id  # reload the instance expired by the factory commits
+            query_counter.reset()
 
             stats = user.get_stats()
 
+            # Stats are aggregated in a single round-trip
+            assert query_counter.count == 1
             assert stats["total_attempts"] == 3
-            assert stats["average_score"] == 80.0  # (70 + 80 + 90) / 3
+            assert stats["avg_score"] == 80.0  # (70 + 80 + 90) / 3
             assert stats["best_score"] == 90.0
 
     def test_user_relationship_with_attempts(self, app):
@@ -261,7 +275,7 @@ class TestQuizModel:
 
             assert quiz.get_average_score() == 0
 
-    def test_get_average_score_with_attempts(self, app):
+    def test_get_average_score_with_attempts(self, app, query_counter):
         """Test getting average score with completed attempts."""
         with app.app_context():
             quiz, questions = create_quiz_with_questions(num_questions=10)
@@ -270,18 +284,26 @@ class TestQuizModel:
             # Create 3 completed attempts
             for score in [6, 8, 10]:
                 AttemptFactory.create_completed(user=user, quiz=quiz, score=score)
+            db.session.flush()
+            _ = quiz.id  # reload the instance expired by the factory commits
+            query_counter.reset()
 
             avg_score = quiz.get_average_score()
+            assert query_counter.count == 1
             assert avg_score == 80.0  # (60 + 80 + 100) / 3
 
-    def test_get_completion_rate_no_attempts(self, app):
+    def test_get_completion_rate_no_attempts(self, app, query_counter):
         """Test getting completion rate with no attempts."""
         with app.app_context():
             quiz = QuizFactory()
+            db.session.flush()
+            _ = quiz.id  # reload the instance expired by the factory commits
+            query_counter.reset()
 
             assert quiz.get_completion_rate() == 0
+            assert query_counter.count == 1
 
-    def test_get_completion_rate_all_completed(self, app):
+    def test_get_completion_rate_all_completed(self, app, query_counter):
         """Test getting completion rate when all attempts completed."""
         with app.app_context():
             quiz, questions = create_quiz_with_questions(num_questions=10)
@@ -290,11 +312,15 @@ class TestQuizModel:
             # Create 3 completed attempts
             for i in range(3):
                 AttemptFactory.create_completed(user=user, quiz=quiz, score=5)
+            db.session.flush()
+            _ = quiz.id  # reload the instance expired by the factory commits
+            query_counter.reset()
 
             completion_rate = quiz.get_completion_rate()
+            assert query_counter.count == 1
             assert completion_rate == 100.0
 
-    def test_get_completion_rate_partial(self, app):
+    def test_get_completion_rate_partial(self, app, query_counter):
         """Test getting completion rate with partial completion."""
         with app.app_context():
             quiz, questions = create_quiz_with_questions(num_questions=10)
@@ -304,8 +330,12 @@ class TestQuizModel:
             AttemptFactory.create_completed(user=user, quiz=quiz, score=5)
             AttemptFactory.create_completed(user=user, quiz=quiz, score=7)
             AttemptFactory.create_in_progress(user=user, quiz=quiz)
+            db.session.flush()
+            _ = quiz.id  # reload the instance expired by the factory commits
+            query_counter.reset()
 
             completion_rate = quiz.get_completion_rate()
+            assert query_counter.count == 1
             assert completion_rate == pytest.approx(66.67, rel=0.01)
 
     def test_to_dict(self, app):
@@ -339,7 +369,7 @@ class TestQuestionModel:
     def test_get_correct_option_text(self, app):
         """Test getting correct option text."""
         with app.app_context():
-            question = QuestionFactory(
+            question = QuestionFactory.build_fast(
                 option_1="A", option_2="B", option_3="C", option_4="D", correct_answer=2
             )
 
@@ -348,14 +378,14 @@ class TestQuestionModel:
     def test_check_answer_correct(self, app):
         """Test checking correct answer."""
         with app.app_context():
-            question = QuestionFactory(correct_answer=1)
+            question = QuestionFactory.build_fast(correct_answer=1)
 
             assert question.check_answer(1) is True
 
     def test_check_answer_incorrect(self, app):
         """Test checking incorrect answer."""
         with app.app_context():
-            question = QuestionFactory(correct_answer=1)
+            question = QuestionFactory.build_fast(correct_answer=1)
 
             assert question.check_answer(2) is False
 
@@ -502,18 +532,20 @@ class TestUserAnswerModel:
     def test_get_selected_option_text(self, app):
         """Test getting selected option text."""
         with app.app_context():
-            question = QuestionFactory(option_1="A", option_2="B", option_3="C", option_4="D")
-            answer = UserAnswerFactory(question=question, selected_answer=1)
+            question = QuestionFactory.build_fast(
+                option_1="A", option_2="B", option_3="C", option_4="D"
+            )
+            answer = UserAnswer(question=question, selected_answer=1)
 
             assert answer.get_selected_option_text() == "B"
 
     def test_get_correct_option_text(self, app):
         """Test getting correct option text."""
         with app.app_context():
-            question = QuestionFactory(
+            question = QuestionFactory.build_fast(
                 option_1="A", option_2="B", option_3="C", option_4="D", correct_answer=2
             )
-            answer = UserAnswerFactory(question=question)
+            answer = UserAnswer(question=question)
 
             assert answer.get_correct_option_text() == "C"
 
@@ -6,342 +6,298 @@ Tests business logic in service classes.
 
 from datetime import datetime, timedelta
 
+import factory
 import pytest
+from freezegun import freeze_time
 
 from app.extensions import db
 from app.models import User
 from app.services.auth_service import AuthService
 from tests.factories import LockedUserFactory, UnverifiedUserFactory, UserFactory
 
+FROZEN_NOW = datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _has(text, *keywords):
+    """Return True if any keyword appears in text, ignoring case."""
+    folded = text.casefold()
+    return any(kw in folded for kw in keywords)
+
+
+@pytest.fixture
+def frozen_time():
+    """Pin datetime.utcnow() to FROZEN_NOW for tests that assert on token expiry."""
+    with freeze_time(FROZEN_NOW) as frozen:
+        yield frozen
+
 
 @pytest.mark.unit
 @pytest.mark.services
 class TestAuthService:
     """Tests for AuthService."""
 
-    def test_register_user_success(self, app):
+    def test_register_user_success(self):
         """Test successful user registration."""
-        with app.app_context():
-            user, error = AuthService.register_user(
-                username="newuser", email="newuser@example.com", password="SecurePass123"
-            )
-
-            assert error is None
-            assert user is not None
-            assert user.username == "newuser"
-            assert user.email == "newuser@example.com"
-            assert user.password_hash is not None
-            assert user.is_active is True
-            assert user.email_verified is False
-            assert user.verification_token is not None
-
-    def test_register_user_duplicate_username(self, app):
-        """Test registration with existing username."""
-        with app.app_context():
-            UserFactory(username="existinguser")
-            db.session.commit()
-
-            user, error = AuthService.register_user(
-                username="existinguser", email="newemail@example.com", password="SecurePass123"
-            )
-
-            assert user is None
-            assert "username" in error.lower()
-
-    def test_register_user_duplicate_email(self, app):
-        """Test registration with existing email."""
-        with app.app_context():
-            UserFactory(email="existing@example.com")
-            db.session.commit()
-
-            user, error = AuthService.register_user(
-                username="newuser", email="existing@example.com", password="SecurePass123"
-            )
-
-            assert user is None
-            assert "email" in error.lower()
-
-    def test_authenticate_user_success(self, app):
+        user, error = AuthService.register_user(
+            username="newuser", email="newuser@example.com", password="SecurePass123"
+        )
+
+        assert error is None
+        assert user is not None
+        assert user.username == "newuser"
+        assert user.email == "newuser@example.com"
+        assert user.password_hash is not None
+        assert user.is_active is True
+        assert user.email_verified is False
+        assert user.verification_token is not None
+
+    @pytest.mark.parametrize(
+        "existing, username, email, expected_kw",
+        [
+            ({"username": "existinguser"}, "existinguser", "newemail@example.com", "username"),
+            ({"email": "existing@example.com"}, "newuser", "existing@example.com", "email"),
+        ],
+        ids=["username", "email"],
+    )
+    def test_register_user_duplicate(self, existing, username, email, expected_kw):
+        """Test registration with an existing username or email."""
+        UserFactory(**existing)
+
+        user, error = AuthService.register_user(
+            username=username, email=email, password="SecurePass123"
+        )
+
+        assert user is None
+        assert _has(error, expected_kw)
+
+    def test_authenticate_user_success(self):
         """Test successful authentication with username."""
-        with app.app_context():
-            user = UserFactory(username="testuser")
-            user.set_password("TestPass123")
-            db.session.commit()
+        user = UserFactory(username="testuser")
 
-            auth_user, error = AuthService.authenticate_user(
-                username_or_email="testuser", password="TestPass123"
-            )
+        auth_user, error = AuthService.authenticate_user(
+            username_or_email="testuser", password="TestPass123"
+        )
 
-            assert error is None
-            assert auth_user is not None
-            assert auth_user.id == user.id
-            assert auth_user.failed_login_attempts == 0
+        assert error is None
+        assert auth_user is not None
+        assert auth_user.id == user.id
+        assert auth_user.failed_login_attempts == 0
 
-    def test_authenticate_user_with_email(self, app):
+    def test_authenticate_user_with_email(self):
         """Test successful authentication with email."""
-        with app.app_context():
-            user = UserFactory(email="test@example.com")
-            user.set_password("TestPass123")
-            db.session.commit()
-
-            auth_user, error = AuthService.authenticate_user(
-                username_or_email="test@example.com", password="TestPass123"
-            )
-
-            assert error is None
-            assert auth_user is not None
-            assert auth_user.id == user.id
-
-    def test_authenticate_user_wrong_password(self, app):
-        """Test authentication with incorrect password."""
-        with app.app_context():
-            user = UserFactory(username="testuser")
-            user.set_password("TestPass123")
-            db.session.commit()
-
-            auth_user, error = AuthService.authenticate_user(
-                username_or_email="testuser", password="WrongPassword"
-            )
-
-            assert auth_user is None
-            assert error is not None
-            assert "invalid" in error.lower()
-
-            # Check failed login attempt was recorded
-            db.session.refresh(user)
-            assert user.failed_login_attempts == 1
-
-    def test_authenticate_user_nonexistent(self, app):
-        """Test authentication with non-existent user."""
-        with app.app_context():
-            auth_user, error = AuthService.authenticate_user(
-                username_or_email="nonexistent", password="AnyPassword"
-            )
-
-            assert auth_user is None
-            assert error is not None
-
-    def test_authenticate_user_account_locked(self, app):
-        """Test authentication with locked account."""
-        with app.app_context():
-            user = LockedUserFactory(username="lockeduser")
-            user.set_password("TestPass123")
-            db.session.commit()
-
-            auth_user, error = AuthService.authenticate_user(
-                username_or_email="lockeduser", password="TestPass123"
-            )
-
-            assert auth_user is None
-            assert error is not None
-            assert "locked" in error.lower()
-
-    def test_authenticate_user_inactive(self, app):
-        """Test authentication with inactive account."""
-        with app.app_context():
-            user = UserFactory(username="inactive", is_active=False)
-            user.set_password("TestPass123")
-            db.session.commit()
-
-            auth_user, error = AuthService.authenticate_user(
-                username_or_email="inactive", password="TestPass123"
-            )
-
-            assert auth_user is None
-            assert error is not None
-            assert "inactive" in error.lower() or "deactivated" in error.lower()
-
-    def test_verify_email_success(self, app):
+        user = UserFactory(email="test@example.com")
+
+        auth_user, error = AuthService.authenticate_user(
+            username_or_email="test@example.com", password="TestPass123"
+        )
+
+        assert error is None
+        assert auth_user is not None
+        assert auth_user.id == user.id
+
+    @pytest.mark.parametrize(
+        "user_factory, user_kwargs, username, password, expected_kws",
+        [
+            (UserFactory, {"username": "testuser"}, "testuser", "WrongPassword", ("invalid",)),
+            (None, {}, "nonexistent", "AnyPassword", ()),
+            (
+                LockedUserFactory,
+                {"username": "lockeduser"},
+                "lockeduser",
+                "TestPass123",
+                ("locked",),
+            ),
+            (
+                UserFactory,
+                {"username": "inactive", "is_active": False},
+                "inactive",
+                "TestPass123",
+                ("inactive", "deactivated"),
+            ),
+        ],
+        ids=["wrong_password", "nonexistent", "account_locked", "inactive"],
+    )
+    def test_authenticate_user_rejected(
+        self, user_factory, user_kwargs, username, password, expected_kws
+    ):
+        """Test authentication failures return no user and an error message."""
+        if user_factory is not None:
+            user_factory(**user_kwargs)
+
+        auth_user, error = AuthService.authenticate_user(
+            username_or_email=username, password=password
+        )
+
+        assert auth_user is None
+        assert error is not None
+        if expected_kws:
+            assert _has(error, *expected_kws)
+
+    def test_authenticate_user_wrong_password_records_failure(self):
+        """Test authentication with incorrect password records a failed attempt."""
+        user = UserFactory(username="testuser")
+
+        AuthService.authenticate_user(username_or_email="testuser", password="WrongPassword")
+
+        assert user.failed_login_attempts == 1
+
+    def test_verify_email_success(self):
         """Test successful email verification."""
-        with app.app_context():
-            user = UnverifiedUserFactory()
-            token = user.verification_token
-            db.session.commit()
+        user = UnverifiedUserFactory()
+        token = user.verification_token
 
-            success, message = AuthService.verify_email(token)
+        success, message = AuthService.verify_email(token)
 
-            assert success is True
-            assert "success" in message.lower() or "verified" in message.lower()
+        assert success is True
+        assert _has(message, "success", "verified")
 
-            db.session.refresh(user)
-            assert user.email_verified is True
-            assert user.verification_token is None
+        assert user.email_verified is True
+        assert user.verification_token is None
 
-    def test_verify_email_invalid_token(self, app):
+    def test_verify_email_invalid_token(self):
         """Test email verification with invalid token."""
-        with app.app_context():
-            success, message = AuthService.verify_email("invalid_token")
+        success, message = AuthService.verify_email("invalid_token")
 
-            assert success is False
-            assert "invalid" in message.lower()
+        assert success is False
+        assert _has(message, "invalid")
 
-    def test_verify_email_already_verified(self, app):
+    def test_verify_email_already_verified(self):
         """Test email verification for already verified user."""
-        with app.app_context():
-            _ = UserFactory(email_verified=True, verification_token="old_token")
-            db.session.commit()
+        _ = UserFactory(email_verified=True, verification_token="old_token")
 
-            success, message = AuthService.verify_email("old_token")
+        success, message = AuthService.verify_email("old_token")
 
-            assert success is False
-            assert "already" in message.lower()
+        assert success is False
+        assert _has(message, "already")
 
-    def test_request_password_reset_success(self, app):
+    def test_request_password_reset_success(self, frozen_time):
         """Test successful password reset request."""
-        with app.app_context():
-            user = UserFactory(email="test@example.com")
-            db.session.commit()
+        user = UserFactory(email="test@example.com")
 
-            success, message = AuthService.request_password_reset("test@example.com")
+        success, message = AuthService.request_password_reset("test@example.com")
 
-            assert success is True
-            assert "sent" in message.lower() or "instructions" in message.lower()
+        assert success is True
+        assert _has(message, "sent", "instructions")
 
-            db.session.refresh(user)
-            assert user.password_reset_token is not None
-            assert user.reset_token_expires is not None
-            assert user.reset_token_expires > datetime.utcnow()
+        assert user.password_reset_token is not None
+        assert user.reset_token_expires is not None
+        assert user.reset_token_expires == FROZEN_NOW + timedelta(hours=1)
 
-    def test_request_password_reset_nonexistent_email(self, app):
+    def test_request_password_reset_nonexistent_email(self):
         """Test password reset for non-existent email."""
-        with app.app_context():
-            success, message = AuthService.request_password_reset("nonexistent@example.com")
+        success, message = AuthService.request_password_reset("nonexistent@example.com")
 
-            # Should return success to prevent email enumeration
-            assert success is True
+        # Should return success to prevent email enumeration
+        assert success is True
 
-    def test_reset_password_success(self, app):
+    def test_reset_password_success(self):
         """Test successful password reset."""
-        with app.app_context():
-            user = UserFactory()
-            token = user.generate_reset_token()
-            old_password_hash = user.password_hash
-            db.session.commit()
-
-            success, message = AuthService.reset_password(
-                token=token, new_password="NewSecurePass123"
-            )
-
-            assert success is True
-            assert "success" in message.lower() or "reset" in message.lower()
-
-            db.session.refresh(user)
-            assert user.password_hash != old_password_hash
-            assert user.check_password("NewSecurePass123") is True
-            assert user.password_reset_token is None
-            assert user.reset_token_expires is None
-
-    def test_reset_password_invalid_token(self, app):
+        user = UserFactory()
+        token = user.generate_reset_token()
+        old_password_hash = user.password_hash
+
+        success, message = AuthService.reset_password(token=token, new_password="NewSecurePass123")
+
+        assert success is True
+        assert _has(message, "success", "reset")
+
+        assert user.password_hash != old_password_hash
+        assert user.check_password("NewSecurePass123") is True
+        assert user.password_reset_token is None
+        assert user.reset_token_expires is None
+
+    def test_reset_password_invalid_token(self):
         """Test password reset with invalid token."""
-        with app.app_context():
-            success, message = AuthService.reset_password(
-                token="invalid_token", new_password="NewPassword123"
-            )
+        success, message = AuthService.reset_password(
+            token="invalid_token", new_password="NewPassword123"
+        )
 
-            assert success is False
-            assert "invalid" in message.lower() or "expired" in message.lower()
+        assert success is False
+        assert _has(message, "invalid", "expired")
 
-    def test_reset_password_expired_token(self, app):
+    def test_reset_password_expired_token(self, frozen_time):
         """Test password reset with expired token."""
-        with app.app_context():
-            user = UserFactory()
-            token = user.generate_reset_token()
-            user.reset_token_expires = datetime.utcnow() - timedelta(hours=1)
-            db.session.commit()
+        user = UserFactory()
+        token = user.generate_reset_token(expires_in=3600)
+        frozen_time.tick(timedelta(hours=1, seconds=1))
 
-            success, message = AuthService.reset_password(
-                token=token, new_password="NewPassword123"
-            )
+        success, message = AuthService.reset_password(token=token, new_password="NewPassword123")
 
-            assert success is False
-            assert "expired" in message.lower()
+        assert success is False
+        assert _has(message, "expired")
 
-    def test_change_password_success(self, app):
+    def test_change_password_success(self):
         """Test successful password change."""
-        with app.app_context():
-            user = UserFactory()
-            user.set_password("OldPass123")
-            old_password_hash = user.password_hash
-            db.session.commit()
+        user = UserFactory()
+        user.set_password("OldPass123")
+        old_password_hash = user.password_hash
 
-            success, message = AuthService.change_password(
-                user=user, current_password="OldPass123", new_password="NewPass123"
-            )
+        success, message = AuthService.change_password(
+            user=user, current_password="OldPass123", new_password="NewPass123"
+        )
 
-            assert success is True
-            assert "success" in message.lower() or "changed" in message.lower()
+        assert success is True
+        assert _has(message, "success", "changed")
 
-            db.session.refresh(user)
-            assert user.password_hash != old_password_hash
-            assert user.check_password("NewPass123") is True
+        assert user.password_hash != old_password_hash
+        assert user.check_password("NewPass123") is True
 
-    def test_change_password_wrong_current(self, app):
+    def test_change_password_wrong_current(self):
         """Test password change with wrong current password."""
-        with app.app_context():
-            user = UserFactory()
-            user.set_password("OldPass123")
-            db.session.commit()
+        user = UserFactory()
+        user.set_password("OldPass123")
 
-            success, message = AuthService.change_password(
-                user=user, current_password="WrongPassword", new_password="NewPass123"
-            )
+        success, message = AuthService.change_password(
+            user=user, current_password="WrongPassword", new_password="NewPass123"
+        )
 
-            assert success is False
-            assert "current" in message.lower() or "incorrect" in message.lower()
+        assert success is False
+        assert _has(message, "current", "incorrect")
 
-    def test_update_profile_success(self, app):
+    def test_update_profile_success(self):
         """Test successful profile update."""
-        with app.app_context():
-            user = UserFactory(username="olduser", email="old@example.com")
-            db.session.commit()
-
-            success, message = AuthService.update_profile(
-                user=user, username="newuser", email="new@example.com"
-            )
-
-            assert success is True
-            assert "success" in message.lower() or "updated" in message.lower()
-
-            db.session.refresh(user)
-            assert user.username == "newuser"
-            assert user.email == "new@example.com"
-
-    def test_update_profile_duplicate_username(self, app):
-        """Test profile update with duplicate username."""
-        with app.app_context():
-            UserFactory(username="existinguser")
-            user = UserFactory(username="myuser")
-            db.session.commit()
-
-            success, message = AuthService.update_profile(
-                user=user, username="existinguser", email="new@example.com"
-            )
-
-            assert success is False
-            assert "username" in message.lower()
-
-    def test_update_profile_duplicate_email(self, app):
-        """Test profile update with duplicate email."""
-        with app.app_context():
-            UserFactory(email="existing@example.com")
-            user = UserFactory(email="myemail@example.com")
-            db.session.commit()
-
-            success, message = AuthService.update_profile(
-                user=user, username="newusername", email="existing@example.com"
-            )
-
-            assert success is False
-            assert "email" in message.lower()
-
-    def test_update_profile_no_changes(self, app):
+        user = UserFactory(username="olduser", email="old@example.com")
+
+        success, message = AuthService.update_profile(
+            user=user, username="newuser", email="new@example.com"
+        )
+
+        assert success is True
+        assert _has(message, "success", "updated")
+
+        assert user.username == "newuser"
+        assert user.email == "new@example.com"
+
+    @pytest.mark.parametrize(
+        "field, values, username, email",
+        [
+            ("username", ["existinguser", "myuser"], "existinguser", "new@example.com"),
+            (
+                "email",
+                ["existing@example.com", "myemail@example.com"],
+                "newusername",
+                "existing@example.com",
+            ),
+        ],
+        ids=["username", "email"],
+    )
+    def test_update_profile_duplicate(self, field, values, username, email):
+        """Test profile update with a username or email that is already taken."""
+        existing, user = UserFactory.build_batch(2, **{field: factory.Iterator(values)})
+        db.session.add_all([existing, user])
+        db.session.flush()
+
+        success, message = AuthService.update_profile(user=user, username=username, email=email)
+
+        assert success is False
+        assert _has(message, field)
+
+    def test_update_profile_no_changes(self):
         """Test profile update with no actual changes."""
-        with app.app_context():
-            user = UserFactory(username="myuser", email="myemail@example.com")
-            db.session.commit()
+        user = UserFactory(username="myuser", email="myemail@example.com")
 
-            success, message = AuthService.update_profile(
-                user=user, username="myuser", email="myemail@example.com"
-            )
+        success, message = AuthService.update_profile(
+            user=user, username="myuser", email="myemail@example.com"
+        )
 
-            assert success is True
+        assert success is True
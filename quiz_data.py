@@ -1,6 +1,26 @@
 # Quiz questions covering AI software development concepts
 
-QUIZ_DATA = [
+import random
+import sys
+from types import MappingProxyType
+
+__all__ = [
+    "QUIZ_DATA",
+    "get_all_categories",
+    "get_all_topics",
+    "get_questions_by_category",
+    "get_questions_by_topic",
+    "get_total_questions",
+    "get_all_difficulties",
+    "get_questions_by_difficulty",
+    "get_questions_by_category_and_difficulty",
+    "get_questions_by_topic_and_difficulty",
+    "sample_questions",
+    "get_difficulty_stats",
+    "get_category_stats",
+]
+
+QUIZ_DATA = (
     # Category 1: Agent Fundamentals (8 questions)
     {
         "category": "Agent Fundamentals",
@@ -532,59 +552,82 @@ QUIZ_DATA = [
         "difficulty": "easy",
         "explanation": "Multimodal models like Claude with vision can analyze images, screenshots, diagrams, and charts, making them essential for tasks involving visual content interpretation or document analysis."
     },
-]
+)
 
-def get_all_topics():
-    """Get list of all unique categories (kept for backwards compatibility)"""
-    return list(set(q.get("category", q.get("topic", "General")) for q in QUIZ_DATA))
 
-def get_all_categories():
-    """Get list of all unique categories"""
-    return list(set(q.get("category", "General") for q in QUIZ_DATA))
+# Indexes built once at import so the filter helpers are dict lookups instead of list scans
+_BY_CATEGORY = {}
+_BY_DIFFICULTY = {}
+_BY_CAT_DIFF = {}
+_frozen = []
+for _q in QUIZ_DATA:
+    # Older records used "topic"; normalize once so everything below can read "category"
+    _q.setdefault("category", _q.get("topic", "General"))
+    # Interned keys let lookups with the same interned string match on identity
+    _q["category"] = sys.intern(_q["category"])
+    _q["difficulty"] = sys.intern(_q["difficulty"])
+    _q["options"] = tuple(_q["options"])
+    # Records are shared by every getter, so expose them read-only
+    _q = MappingProxyType(_q)
+    _frozen.append(_q)
+    _BY_CATEGORY.setdefault(_q["category"], []).append(_q)
+    _BY_DIFFICULTY.setdefault(_q["difficulty"], []).append(_q)
+    _BY_CAT_DIFF.setdefault((_q["category"], _q["difficulty"]), []).append(_q)
+QUIZ_DATA = tuple(_frozen)
+del _q, _frozen
+
+# Freeze the buckets too, so getters can hand them out without copying
+_BY_CATEGORY = {k: tuple(v) for k, v in _BY_CATEGORY.items()}
+_BY_DIFFICULTY = {k: tuple(v) for k, v in _BY_DIFFICULTY.items()}
+_BY_CAT_DIFF = {k: tuple(v) for k, v in _BY_CAT_DIFF.items()}
+
+_ALL_CATEGORIES = tuple(_BY_CATEGORY)
 
-def get_questions_by_topic(topic):
-    """Get all questions for a specific category (kept for backwards compatibility)"""
-    return [q for q in QUIZ_DATA if q.get("category", q.get("topic")) == topic]
+_DIFFICULTIES = ("easy", "medium", "hard")
+
+# QUIZ_DATA never changes at runtime, so the counts are fixed too
+_TOTAL = len(QUIZ_DATA)
+_DIFFICULTY_STATS = MappingProxyType({d: len(_BY_DIFFICULTY.get(d, ())) for d in _DIFFICULTIES})
+_CATEGORY_STATS = MappingProxyType({c: len(qs) for c, qs in _BY_CATEGORY.items()})
+
+def get_all_categories():
+    """Get tuple of all unique categories"""
+    return _ALL_CATEGORIES
 
 def get_questions_by_category(category):
-    """Get all questions for a specific category"""
-    return [q for q in QUIZ_DATA if q.get("category") == category]
+    """Get tuple of all questions for a specific category"""
+    return _BY_CATEGORY.get(category, ())
 
 def get_total_questions():
     """Get total number of questions"""
-    return len(QUIZ_DATA)
+    return _TOTAL
 
 def get_all_difficulties():
-    """Get list of all unique difficulty levels"""
-    return ["easy", "medium", "hard"]
+    """Get tuple of all unique difficulty levels"""
+    return _DIFFICULTIES
 
 def get_questions_by_difficulty(difficulty):
-    """Get all questions for a specific difficulty level"""
-    return [q for q in QUIZ_DATA if q.get("difficulty") == difficulty]
-
-def get_questions_by_topic_and_difficulty(topic, difficulty):
-    """Get questions filtered by both category and difficulty (kept for backwards compatibility)"""
-    return [q for q in QUIZ_DATA
-            if q.get("category", q.get("topic")) == topic and q.get("difficulty") == difficulty]
+    """Get tuple of all questions for a specific difficulty level"""
+    return _BY_DIFFICULTY.get(difficulty, ())
 
 def get_questions_by_category_and_difficulty(category, difficulty):
-    """Get questions filtered by both category and difficulty"""
-    return [q for q in QUIZ_DATA
-            if q.get("category") == category and q.get("difficulty") == difficulty]
+    """Get tuple of questions filtered by both category and difficulty"""
+    return _BY_CAT_DIFF.get((category, difficulty), ())
+
+# "topic" was the old name for "category"; these aliases are kept for backwards compatibility
+get_all_topics = get_all_categories
+get_questions_by_topic = get_questions_by_category
+get_questions_by_topic_and_difficulty = get_questions_by_category_and_difficulty
+
+def sample_questions(category, difficulty, k):
+    """Get up to k random questions for a category and difficulty, without repeats"""
+    pool = _BY_CAT_DIFF.get((category, difficulty), ())
+    return random.sample(pool, min(k, len(pool)))
 
 def get_difficulty_stats():
-    """Get count of questions for each difficulty level"""
-    stats = {"easy": 0, "medium": 0, "hard": 0}
-    for question in QUIZ_DATA:
-        difficulty = question.get("difficulty", "unknown")
-        if difficulty in stats:
-            stats[difficulty] += 1
-    return stats
+    """Get read-only mapping of question counts for each difficulty level"""
+    return _DIFFICULTY_STATS
 
 def get_category_stats():
-    """Get count of questions for each category"""
-    stats = {}
-    for question in QUIZ_DATA:
-        category = question.get("category", "General")
-        stats[category] = stats.get(category, 0) + 1
-    return stats
+    """Get read-only mapping of question counts for each category"""
+    return _CATEGORY_STATS